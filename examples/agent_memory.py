@@ -10,6 +10,7 @@ Usage:
 import sys
 import json
 from datetime import datetime
+from typing import List
 
 sys.path.insert(0, "sdk/python")
 from nexus_client import NexusClient, NexusError
@@ -18,42 +19,43 @@ from nexus_client import NexusClient, NexusError
 def simulate_agent_session(client: NexusClient, session_id: int):
     """Simulate an agent session that remembers past interactions."""
     
-    print(f"\n🤖 Agent Session {session_id}")
-    print("-" * 40)
+    # Collect the session report and write it out in one go at the end
+    lines: List[str] = [f"\n🤖 Agent Session {session_id}", "-" * 40]
     
     # Check for previous sessions
     visit_count = client.memory_recall("visit_count")
     if visit_count:
         count = int(visit_count) + 1
-        print(f"   Welcome back! This is visit #{count}")
+        lines.append(f"   Welcome back! This is visit #{count}")
     else:
         count = 1
-        print("   First visit! Nice to meet you.")
+        lines.append("   First visit! Nice to meet you.")
     
-    # Update visit count
-    client.memory_store("visit_count", str(count))
-    
-    # Store last visit time
+    # Show last visit time
     now = datetime.now().isoformat()
     last_visit = client.memory_recall("last_visit")
     if last_visit:
-        print(f"   Last visit: {last_visit}")
-    
-    client.memory_store("last_visit", now)
-    print(f"   Current time: {now}")
+        lines.append(f"   Last visit: {last_visit}")
+    lines.append(f"   Current time: {now}")
     
-    # Store session notes
+    # Save visit count, visit time and session notes in one call
     note_key = f"session_{session_id}_notes"
-    client.memory_store(note_key, json.dumps({
-        "session_id": session_id,
-        "timestamp": now,
-        "message": f"Session {session_id} completed successfully"
-    }))
-    print(f"   Session notes saved to: {note_key}")
+    client.memory_mset({
+        "visit_count": str(count),
+        "last_visit": now,
+        note_key: json.dumps({
+            "session_id": session_id,
+            "timestamp": now,
+            "message": f"Session {session_id} completed successfully"
+        }),
+    })
+    lines.append(f"   Session notes saved to: {note_key}")
     
     # List all memory keys
     keys = client.memory_list()
-    print(f"\n   📚 Memory contains {len(keys)} entries: {', '.join(keys)}")
+    lines.append(f"\n   📚 Memory contains {len(keys)} entries: {', '.join(keys)}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
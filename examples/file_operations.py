@@ -15,6 +15,9 @@ import os
 sys.path.insert(0, "sdk/python")
 from nexus_client import NexusClient, NexusError
 
+# Line separator used to indent multi-line file content in the output
+NL_INDENT = "\n   "
+
 
 def main():
     print("=" * 50)
@@ -42,7 +45,7 @@ def main():
             # Read it back
             print(f"\n📖 Reading from: {test_file}")
             content = client.call_text("fs.read_file", {"path": test_file})
-            print(f"   Content:\n   {content.replace(chr(10), chr(10) + '   ')}")
+            print("   Content:\n   " + NL_INDENT.join(content.split("\n")))
             
         except NexusError as e:
             print(f"\n⚠️  File operation restricted: {e}")
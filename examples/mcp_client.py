@@ -13,20 +13,119 @@ Run:
     # Terminal 2: Run client
     python3 examples/mcp_client.py
 """
+import asyncio
+import http.client
 import json
-import urllib.request
-import urllib.error
-from typing import Any, Dict, Optional
+import select
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads, _dumps = orjson.loads, orjson.dumps
+else:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
 
 class McpClient:
     """A minimal MCP client using HTTP transport (stdlib only)."""
     
-    def __init__(self, base_url: str = "http://localhost:9000"):
+    def __init__(self, base_url: str = "http://localhost:9000", timeout: float = 30,
+                 retries: int = 2, backoff_factor: float = 0.1):
         self.base_url = base_url
         self.mcp_endpoint = f"{base_url}/mcp"
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
         self.request_id = 0
         self.initialized = False
+        
+        # One keep-alive connection is reused for every request
+        url = urlsplit(base_url)
+        self._host = url.netloc
+        self._path = url.path.rstrip("/")
+        self._connection_class = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self._connection: Optional[http.client.HTTPConnection] = None
+    
+    def __enter__(self) -> "McpClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    def _request(self, method: str, path: str, body: Optional[bytes] = None) -> Tuple[int, bytes]:
+        """Perform an HTTP request over the persistent connection.
+        
+        Failed connection attempts are retried with exponential backoff. A
+        request is re-sent only when sending it over a reused keep-alive
+        connection fails, i.e. the server closed the connection before
+        reading it. Errors after the request was sent are raised, since the
+        server may already have processed it.
+        """
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        attempt = 0
+        while True:
+            if self._connection is not None and self._connection_dropped():
+                self.close()
+            reused = self._connection is not None
+            if not reused:
+                try:
+                    self._connection = self._connection_class(self._host, timeout=self.timeout)
+                    self._connection.connect()
+                except OSError:
+                    self.close()
+                    if attempt >= self.retries:
+                        raise
+                    time.sleep(self.backoff_factor * 2 ** attempt)
+                    attempt += 1
+                    continue
+            try:
+                self._connection.request(method, self._path + path, body=body, headers=headers)
+            except (BrokenPipeError, ConnectionResetError):
+                self.close()
+                if not reused:
+                    raise
+                continue
+            except (OSError, http.client.HTTPException):
+                self.close()
+                raise
+            try:
+                response = self._connection.getresponse()
+                return response.status, response.read()
+            except (OSError, http.client.HTTPException):
+                # e.g. a timeout: the connection is mid-request and unusable
+                self.close()
+                raise
+    
+    def _connection_dropped(self) -> bool:
+        """Whether the idle keep-alive connection was closed by the server.
+        
+        An idle connection has nothing to read, so a readable socket means
+        the server has closed it (or sent something unexpected).
+        """
+        sock = self._connection.sock
+        if sock is None:
+            return True
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
     
     def _next_id(self) -> int:
         self.request_id += 1
@@ -42,21 +141,56 @@ class McpClient:
         if params:
             payload["params"] = params
         
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            self.mcp_endpoint,
-            data=data,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode('utf-8'))
+        result = self._post(payload)
         
         if "error" in result:
             raise Exception(f"MCP Error: {result['error']}")
         
         return result.get("result", {})
     
+    def _post(self, payload: Any) -> Any:
+        """POST a JSON-RPC payload (object or batch array) and decode the reply."""
+        status, body = self._request("POST", "/mcp", _dumps(payload))
+        
+        if status >= 400:
+            raise Exception(f"HTTP {status}: {body.decode('utf-8', 'replace')}")
+        
+        return _loads(body)
+    
+    def batch(self, calls: List[Tuple[str, Optional[Dict]]]) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC requests in a single HTTP round-trip.
+        
+        JSON-RPC does not guarantee the order of responses in a batch, so
+        they are matched back to their requests by id. Results are returned
+        in the same order as ``calls``.
+        """
+        payload = []
+        for method, params in calls:
+            request = {
+                "jsonrpc": "2.0",
+                "method": method,
+                "id": self._next_id()
+            }
+            if params:
+                request["params"] = params
+            payload.append(request)
+        
+        responses = self._post(payload)
+        if isinstance(responses, dict):
+            # The server rejected the batch as a whole
+            raise Exception(f"MCP Error: {responses.get('error', responses)}")
+        
+        by_id = {response.get("id"): response for response in responses}
+        results = []
+        for request in payload:
+            response = by_id.get(request["id"])
+            if response is None:
+                raise Exception(f"MCP Error: no response for request {request['id']}")
+            if "error" in response:
+                raise Exception(f"MCP Error: {response['error']}")
+            results.append(response.get("result", {}))
+        return results
+    
     def initialize(self, client_name: str = "python-mcp-client") -> Dict[str, Any]:
         """Initialize the MCP session."""
         result = self._send("initialize", {
@@ -96,107 +230,200 @@ class McpClient:
     def health_check(self) -> bool:
         """Check if the server is healthy."""
         try:
-            with urllib.request.urlopen(f"{self.base_url}/health") as resp:
-                return resp.status == 200
-        except:
+            status, _ = self._request("GET", "/health")
+            return status == 200
+        except (OSError, http.client.HTTPException):
+            self.close()
             return False
 
 
+class AsyncMcpClient:
+    """An asyncio MCP client for issuing independent calls concurrently.
+    
+    Requests run on a small thread pool where each worker owns its own
+    McpClient, and therefore its own keep-alive connection, so wall time
+    for N independent calls is close to the slowest call rather than the
+    sum of all of them.
+    """
+    
+    def __init__(self, base_url: str = "http://localhost:9000",
+                 max_connections: int = 8, timeout: float = 30):
+        self.base_url = base_url
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_connections)
+        self._local = threading.local()
+        self._clients: List[McpClient] = []
+        self._clients_lock = threading.Lock()
+    
+    async def __aenter__(self) -> "AsyncMcpClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the worker threads and close their connections."""
+        self._executor.shutdown(wait=True)
+        with self._clients_lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+    
+    def _client(self) -> McpClient:
+        """Return the McpClient owned by the current worker thread."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = McpClient(self.base_url, self.timeout)
+            self._local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+    
+    async def _run(self, method: str, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: getattr(self._client(), method)(*args)
+        )
+    
+    async def _send(self, method: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC request and return the result."""
+        return await self._run("_send", method, params)
+    
+    async def list_tools(self) -> Dict[str, Any]:
+        """List available tools."""
+        return await self._send("tools/list")
+    
+    async def call_tool(self, name: str, arguments: Optional[Dict] = None) -> Dict[str, Any]:
+        """Call a tool by name."""
+        return await self._send("tools/call", {
+            "name": name,
+            "arguments": arguments or {}
+        })
+    
+    async def read_resource(self, uri: str) -> Dict[str, Any]:
+        """Read a specific resource."""
+        return await self._send("resources/read", {"uri": uri})
+    
+    def call_tool_sync(self, name: str, arguments: Optional[Dict] = None) -> Dict[str, Any]:
+        """Call a tool from synchronous code (not from inside a running loop)."""
+        return asyncio.run(self.call_tool(name, arguments))
+
+
+async def call_tools_concurrently(base_url: str) -> List[Dict[str, Any]]:
+    """Run three independent tool calls at the same time."""
+    async with AsyncMcpClient(base_url) as client:
+        return await asyncio.gather(
+            client.call_tool("echo", {"text": "Hello concurrently!"}),
+            client.call_tool("get_time", {}),
+            client.call_tool("memory.recall", {"key": "mcp_test"}),
+        )
+
+
 def main():
     print("=" * 60)
     print("  MCP Client Example")
     print("=" * 60)
     
-    client = McpClient("http://localhost:9000")
-    
-    # 1. Health check
-    print("\n📡 Checking server health...")
-    if not client.health_check():
-        print("❌ Server is not running!")
-        print("   Start it with: ./target/release/nexus serve --port 9000")
-        return
-    print("   ✓ Server is healthy")
-    
-    # 2. Initialize
-    print("\n🤝 Initializing MCP session...")
-    init_result = client.initialize("demo-client")
-    print(f"   Server: {init_result['serverInfo']['name']} v{init_result['serverInfo']['version']}")
-    print(f"   Capabilities: {list(init_result.get('capabilities', {}).keys())}")
-    
-    # 3. Ping
-    print("\n🏓 Sending ping...")
-    ping_result = client.ping()
-    print(f"   Response: {ping_result}")
-    
-    # 4. List tools
-    print("\n🔧 Listing tools...")
-    tools_result = client.list_tools()
-    tools = tools_result.get("tools", [])
-    print(f"   Found {len(tools)} tools:")
-    for tool in tools[:5]:  # Show first 5
-        print(f"   - {tool['name']}: {tool.get('description', 'No description')[:50]}...")
-    if len(tools) > 5:
-        print(f"   ... and {len(tools) - 5} more")
-    
-    # 5. Call tools
-    print("\n⚡ Calling tools...")
-    
-    # Echo
-    echo_result = client.call_tool("echo", {"text": "Hello from MCP!"})
-    content = echo_result.get("content", [{}])[0].get("text", "")
-    print(f"   echo: {content}")
-    
-    # Get time
-    time_result = client.call_tool("get_time", {})
-    time_content = time_result.get("content", [{}])[0].get("text", "")
-    time_data = json.loads(time_content)
-    print(f"   get_time: {time_data.get('time', 'unknown')}")
-    
-    # Memory operations
-    client.call_tool("memory.store", {"key": "mcp_test", "value": "it works!"})
-    recall_result = client.call_tool("memory.recall", {"key": "mcp_test"})
-    recall_content = recall_result.get("content", [{}])[0].get("text", "")
-    recall_data = json.loads(recall_content)
-    print(f"   memory.recall: {recall_data.get('value', 'not found')}")
-    
-    # 6. List resources
-    print("\n📚 Listing resources...")
-    resources_result = client.list_resources()
-    resources = resources_result.get("resources", [])
-    print(f"   Found {len(resources)} resources:")
-    for resource in resources:
-        print(f"   - {resource['uri']}: {resource.get('name', 'unnamed')}")
-    
-    # 7. Read a resource
-    print("\n📖 Reading KV store resource...")
-    try:
-        kv_result = client.read_resource("nexus://kv")
-        contents = kv_result.get("contents", [])
-        if contents and isinstance(contents, list) and len(contents) > 0:
-            content_item = contents[0]
-            if isinstance(content_item, dict):
-                kv_content = content_item.get("text", "{}")
-                kv_data = json.loads(kv_content)
-                print(f"   Keys in store: {kv_data.get('count', 0)}")
-                for item in kv_data.get("items", [])[:3]:
-                    val = str(item.get('value', ''))[:30]
-                    print(f"   - {item['key']}: {val}...")
+    with McpClient("http://localhost:9000") as client:
+        
+        # 1. Health check
+        print("\n📡 Checking server health...")
+        if not client.health_check():
+            print("❌ Server is not running!")
+            print("   Start it with: ./target/release/nexus serve --port 9000")
+            return
+        print("   ✓ Server is healthy")
+        
+        # 2. Initialize
+        print("\n🤝 Initializing MCP session...")
+        init_result = client.initialize("demo-client")
+        print(f"   Server: {init_result['serverInfo']['name']} v{init_result['serverInfo']['version']}")
+        print(f"   Capabilities: {list(init_result.get('capabilities', {}).keys())}")
+        
+        # 3. Ping
+        print("\n🏓 Sending ping...")
+        ping_result = client.ping()
+        print(f"   Response: {ping_result}")
+        
+        # 4. List tools
+        print("\n🔧 Listing tools...")
+        tools_result = client.list_tools()
+        tools = tools_result.get("tools", [])
+        print(f"   Found {len(tools)} tools:")
+        for tool in tools[:5]:  # Show first 5
+            print(f"   - {tool['name']}: {tool.get('description', 'No description')[:50]}...")
+        if len(tools) > 5:
+            print(f"   ... and {len(tools) - 5} more")
+        
+        # 5. Call tools (one batched request instead of four round-trips)
+        print("\n⚡ Calling tools...")
+        echo_result, time_result, _, recall_result = client.batch([
+            ("tools/call", {"name": "echo", "arguments": {"text": "Hello from MCP!"}}),
+            ("tools/call", {"name": "get_time", "arguments": {}}),
+            ("tools/call", {"name": "memory.store", "arguments": {"key": "mcp_test", "value": "it works!"}}),
+            ("tools/call", {"name": "memory.recall", "arguments": {"key": "mcp_test"}}),
+        ])
+        
+        # Echo
+        content = echo_result.get("content", [{}])[0].get("text", "")
+        print(f"   echo: {content}")
+        
+        # Get time
+        time_content = time_result.get("content", [{}])[0].get("text", "")
+        time_data = _loads(time_content)
+        print(f"   get_time: {time_data.get('time', 'unknown')}")
+        
+        # Memory operations (Nexus runs batch entries in order, so the
+        # recall sees the value stored just before it)
+        recall_content = recall_result.get("content", [{}])[0].get("text", "")
+        recall_data = _loads(recall_content)
+        print(f"   memory.recall: {recall_data.get('value', 'not found')}")
+        
+        # 6. Concurrent calls
+        print("\n🔀 Calling tools concurrently (asyncio)...")
+        results = asyncio.run(call_tools_concurrently(client.base_url))
+        for name, result in zip(["echo", "get_time", "memory.recall"], results):
+            text = result.get("content", [{}])[0].get("text", "")
+            print(f"   {name}: {text}")
+        
+        # 7. List resources
+        print("\n📚 Listing resources...")
+        resources_result = client.list_resources()
+        resources = resources_result.get("resources", [])
+        print(f"   Found {len(resources)} resources:")
+        for resource in resources:
+            print(f"   - {resource['uri']}: {resource.get('name', 'unnamed')}")
+        
+        # 8. Read a resource
+        print("\n📖 Reading KV store resource...")
+        try:
+            kv_result = client.read_resource("nexus://kv")
+            contents = kv_result.get("contents", [])
+            if contents and isinstance(contents, list) and len(contents) > 0:
+                content_item = contents[0]
+                if isinstance(content_item, dict):
+                    kv_content = content_item.get("text", "{}")
+                    kv_data = _loads(kv_content)
+                    print(f"   Keys in store: {kv_data.get('count', 0)}")
+                    for item in kv_data.get("items", [])[:3]:
+                        val = str(item.get('value', ''))[:30]
+                        print(f"   - {item['key']}: {val}...")
+                else:
+                    print(f"   Content: {contents}")
             else:
-                print(f"   Content: {contents}")
-        else:
-            print(f"   Raw result: {kv_result}")
-    except Exception as e:
-        print(f"   Could not read resource: {e}")
-    
-    print("\n" + "=" * 60)
-    print("  MCP Client Example Complete!")
-    print("=" * 60)
+                print(f"   Raw result: {kv_result}")
+        except Exception as e:
+            print(f"   Could not read resource: {e}")
+        
+        print("\n" + "=" * 60)
+        print("  MCP Client Example Complete!")
+        print("=" * 60)
 
 
 if __name__ == "__main__":
     try:
         main()
-    except urllib.error.URLError:
+    except ConnectionError:
         print("❌ Could not connect to Nexus server.")
         print("   Make sure to start it first:")
         print("   ./target/release/nexus serve --port 9000")
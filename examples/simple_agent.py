@@ -12,49 +12,110 @@ Run:
     python3 examples/simple_agent.py
 """
 import sys
+import asyncio
+import atexit
 import json
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 
 sys.path.insert(0, "sdk/python")
 from nexus_client import NexusClient, NexusError
 
+# Command patterns, compiled once at import time
+_NAME_RE = re.compile(r"(?:i'm|i am|my name is|call me)\s+(\w+)", re.I)
+_REMEMBER_RE = re.compile(r"remember\s+(?:that\s+)?(\w+)\s+(?:is|=)\s+(.+)", re.I)
+_RECALL_RE = re.compile(r"(?:what is|recall|what's)\s+(?:my\s+)?(\w+)", re.I)
+_WORD_RE = re.compile(r"[\w']+")
+
+# Command keywords, matched against the words of a command
+_GREET = frozenset({"hello", "hi", "hey", "greet"})
+_LIST = frozenset({"memories", "list"})
+_TIME = frozenset({"time"})
+
 
 class SimpleAgent:
     """A basic agent that uses Nexus tools to accomplish tasks."""
     
-    def __init__(self):
+    def __init__(self, load_state: bool = True):
         self.client = NexusClient()
         self.name = "NexusAgent"
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Memory keys changed since the last flush; written when the
+        # session ends. Every run records its session, greeted or not.
+        self._dirty = {"agent:last_session"}
+        
         # Load agent state from memory
-        self._load_state()
+        self.interaction_count = 0
+        self.last_user = None
+        if load_state:
+            self._load_state()
+    
+    @classmethod
+    async def create(cls) -> "SimpleAgent":
+        """Create an agent from asyncio code, loading its state concurrently."""
+        agent = cls(load_state=False)
+        await agent.aload_state()
+        return agent
     
     def _load_state(self):
         """Load agent state from persistent memory."""
-        self.interaction_count = int(
-            self.client.memory_recall("agent:interaction_count") or "0"
-        )
-        self.last_user = self.client.memory_recall("agent:last_user")
+        # One memory.mget call (pipelined recalls on older servers) instead
+        # of a round-trip per key
+        try:
+            state = self.client.memory_mget(["agent:interaction_count", "agent:last_user"])
+        except NexusError:
+            # Start fresh rather than fail, as a missing key would
+            state = {}
+        self.interaction_count = int(state.get("agent:interaction_count") or "0")
+        self.last_user = state.get("agent:last_user")
     
-    def _save_state(self):
-        """Save agent state to persistent memory."""
-        self.client.memory_store("agent:interaction_count", str(self.interaction_count))
-        self.client.memory_store("agent:last_session", self.session_id)
+    async def aload_state(self):
+        """Async variant of _load_state, usable inside a running event loop."""
+        try:
+            # Independent calls, so send them together instead of one by one
+            count, self.last_user, _ = await asyncio.gather(
+                self.client.memory_recall_async("agent:interaction_count"),
+                self.client.memory_recall_async("agent:last_user"),
+                # Warms the client's cache for the first greeting's get_time
+                self.client.call_text_async("get_time", {}),
+            )
+        except NexusError:
+            count = None
+        self.interaction_count = int(count or "0")
+    
+    def _flush(self):
+        """Write changed agent state to persistent memory in one call."""
+        if not self._dirty:
+            return
+        state = {
+            "agent:interaction_count": str(self.interaction_count),
+            "agent:last_user": self.last_user,
+            "agent:last_session": self.session_id,
+        }
+        self.client.memory_mset({key: state[key] for key in self._dirty})
+        self._dirty.clear()
+    
+    def _flush_at_exit(self):
+        """Flush from the atexit hook, where errors can only be reported."""
+        try:
+            self._flush()
+        except NexusError as e:
+            print(f"Warning: could not save agent state: {e}", file=sys.stderr)
     
     def greet(self, user_name: Optional[str] = None) -> str:
         """Generate a greeting based on context."""
         self.interaction_count += 1
+        self._dirty.update({"agent:interaction_count", "agent:last_session"})
         
         if user_name:
-            self.client.memory_store("agent:last_user", user_name)
             self.last_user = user_name
+            self._dirty.add("agent:last_user")
         
-        # Get current time for context
-        time_data = json.loads(self.client.call_text("get_time", {}))
-        hour = datetime.fromisoformat(time_data["time"].replace("+00:00", "")).hour
+        # Get current time for context (a reading up to a second old is fine)
+        time_data = json.loads(self.client.call_text_cached("get_time", {}, ttl_s=1.0))
+        hour = datetime.fromtimestamp(time_data["timestamp"], tz=timezone.utc).hour
         
         if hour < 12:
             greeting = "Good morning"
@@ -70,7 +131,6 @@ class SimpleAgent:
         else:
             response = f"{greeting}, {name}! Nice to see you again (interaction #{self.interaction_count})."
         
-        self._save_state()
         return response
     
     def remember(self, key: str, value: str) -> str:
@@ -90,8 +150,8 @@ class SimpleAgent:
     
     def list_memories(self) -> str:
         """List all user memories."""
-        all_keys = self.client.memory_list()
-        user_keys = [k.replace("user:", "") for k in all_keys if k.startswith("user:")]
+        prefix = "user:"
+        user_keys = [k[len(prefix):] for k in self.client.memory_list(prefix=prefix)]
         
         if user_keys:
             return f"I remember these things: {', '.join(user_keys)}"
@@ -111,30 +171,31 @@ class SimpleAgent:
     def process_command(self, command: str) -> str:
         """Process a natural language command."""
         cmd = command.lower().strip()
+        words = set(_WORD_RE.findall(cmd))
         
         # Greeting patterns
-        if any(g in cmd for g in ["hello", "hi", "hey", "greet"]):
+        if words & _GREET:
             # Extract name if provided
-            match = re.search(r"(?:i'm|i am|my name is|call me)\s+(\w+)", cmd, re.I)
+            match = _NAME_RE.search(cmd)
             name = match.group(1) if match else None
             return self.greet(name)
         
         # Remember patterns
-        match = re.search(r"remember\s+(?:that\s+)?(\w+)\s+(?:is|=)\s+(.+)", cmd, re.I)
+        match = _REMEMBER_RE.search(cmd)
         if match:
             return self.remember(match.group(1), match.group(2))
         
         # Recall patterns
-        match = re.search(r"(?:what is|recall|what's)\s+(?:my\s+)?(\w+)", cmd, re.I)
+        match = _RECALL_RE.search(cmd)
         if match:
             return self.recall(match.group(1))
         
         # List memories
-        if any(w in cmd for w in ["memories", "what do you remember", "list"]):
+        if words & _LIST or "what do you remember" in cmd:
             return self.list_memories()
         
         # Time
-        if any(w in cmd for w in ["time", "what time", "current time"]):
+        if words & _TIME:
             return self.get_time()
         
         # Echo
@@ -180,7 +241,7 @@ Available commands:
                 
                 if user_input.lower() in ["quit", "exit", "bye"]:
                     print(f"\n{self.name}: Goodbye! See you next time.")
-                    self._save_state()
+                    self._flush()
                     break
                 
                 response = self.process_command(user_input)
@@ -188,7 +249,7 @@ Available commands:
                 
             except KeyboardInterrupt:
                 print(f"\n\n{self.name}: Goodbye!")
-                self._save_state()
+                self._flush()
                 break
             except NexusError as e:
                 print(f"\n{self.name}: Oops, something went wrong: {e}\n")
@@ -200,7 +261,8 @@ def run_demo():
     print("  Simple Agent Demo (non-interactive)")
     print("=" * 50)
     
-    agent = SimpleAgent()
+    agent = asyncio.run(SimpleAgent.create())
+    atexit.register(agent._flush_at_exit)
     
     # Demo commands
     commands = [
@@ -231,6 +293,9 @@ def main():
         run_demo()
     else:
         agent = SimpleAgent()
+        # Registered here rather than in __init__, so the hook does not keep
+        # every agent (and its nexus process) alive
+        atexit.register(agent._flush_at_exit)
         agent.run_interactive()
 
 
@@ -0,0 +1,89 @@
+"""Tests for SimpleAgent against the SDK's fake nexus server.
+
+Run from the repository root:
+    python3 -m unittest discover -s examples/tests
+"""
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "sdk" / "python" / "tests"))
+sys.path.insert(0, str(ROOT / "sdk" / "python"))
+sys.path.insert(0, str(ROOT / "examples"))
+
+import fake_nexus
+from simple_agent import SimpleAgent
+
+
+class SimpleAgentTestCase(unittest.TestCase):
+    """Runs each test against a fresh fake nexus whose memory persists across agents."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = {
+            "PATH": fake_nexus.install(tmp.name),
+            "FAKE_NEXUS_DB": os.path.join(tmp.name, "memory.json"),
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_agent(self) -> SimpleAgent:
+        agent = SimpleAgent()
+        self.addCleanup(agent.client.close)
+        return agent
+
+    def tool_calls(self, agent: SimpleAgent) -> int:
+        """Number of tools/call requests the server has handled, excluding this one."""
+        return agent.client._call_json("test.calls", {})["calls"] - 1
+
+    def test_state_persists_between_agents(self):
+        agent = self.make_agent()
+        agent.greet("alice")
+        agent._flush()
+
+        agent = self.make_agent()
+        self.assertEqual(agent.interaction_count, 1)
+        self.assertEqual(agent.last_user, "alice")
+
+    def test_create_inside_running_loop(self):
+        agent = self.make_agent()
+        agent.greet("bob")
+        agent._flush()
+
+        async def create():
+            return await SimpleAgent.create()
+
+        agent = asyncio.run(create())
+        self.addCleanup(agent.client.close)
+        self.assertEqual(agent.interaction_count, 1)
+        self.assertEqual(agent.last_user, "bob")
+
+        # Two recalls and the get_time warm-up; greet reuses the warm-up
+        self.assertIn("bob", agent.greet())
+        self.assertEqual(self.tool_calls(agent), 3)
+
+    def test_session_saved_without_greeting(self):
+        first = self.make_agent()
+        first._flush()
+
+        agent = self.make_agent()
+        self.assertEqual(agent.client.memory_recall("agent:last_session"), first.session_id)
+
+    def test_unreferenced_agent_stops_process(self):
+        agent = SimpleAgent()
+        process = agent.client._process
+        del agent
+        gc.collect()
+        process.wait(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,31 +3,332 @@
 Usage:
     from nexus_client import NexusClient
     
-    client = NexusClient()
-    result = client.call("echo", {"text": "Hello!"})
-    print(result)
+    with NexusClient() as client:
+        result = client.call("echo", {"text": "Hello!"})
+        print(result)
+
+The client starts a single ``nexus --stdio`` process and reuses it for
+every call, speaking newline-delimited JSON-RPC over its stdin/stdout.
+Independent calls can be overlapped from asyncio code:
+
+    count, time_text = await asyncio.gather(
+        client.memory_recall_async("visit_count"),
+        client.call_text_async("get_time"),
+    )
 """
+import asyncio
+import copy
+import itertools
 import json
 import subprocess
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra in setup.py
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+else:
+    _loads = json.loads
+    
+    def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":")).encode("utf-8")
+
+
+# Maximum number of cached results kept by default
+DEFAULT_CACHE_SIZE = 256
+
+# Encoded form of the common no-arguments call
+_EMPTY_ARGS = b"{}"
+
+
+def _encode_args(args: Dict[str, Any]) -> bytes:
+    """Encode tool arguments once, with sorted keys so they double as a cache key."""
+    return _dumps(args, sort_keys=True) if args else _EMPTY_ARGS
+
+
+def _tool_call_params(tool: str, encoded_args: bytes) -> bytes:
+    """Build the encoded params of a tools/call request around encoded arguments."""
+    return b'{"name":' + _dumps(tool) + b',"arguments":' + encoded_args + b"}"
+
+
+# Placeholder for a cache entry whose JSON text has not been decoded yet
+_UNDECODED = object()
+
+# Default max_age for _call_entry: use the tool's entry in cache_ttls
+_TOOL_TTL = object()
+
+# Tools known not to modify any state; only their results are cached.
+# Calling any other tool drops the cached results, since it may have
+# written to the memory store.
+_READ_ONLY_TOOLS = frozenset({
+    "echo",
+    "get_time",
+    "memory.recall",
+    "memory.list",
+    "memory.mget",
+    "fs.read_file",
+    "env.get",
+    "env.list",
+    "sys.info",
+    "base64.encode",
+    "base64.decode",
+    "json.parse",
+    "json.query",
+    "hash.sha256",
+    "regex.match",
+    "regex.replace",
+})
+
 
 class NexusError(Exception):
     """Error from Nexus execution."""
     pass
 
 
+class _PendingRequests:
+    """Requests awaiting a response, shared with the reader thread."""
+    
+    def __init__(self):
+        # JSON-RPC id -> future for the raw response
+        self.futures: Dict[int, Future] = {}
+        self.lock = threading.Lock()
+        self.closed = False
+
+
+def _read_responses(stdout, pending: _PendingRequests) -> None:
+    """Resolve pending requests as responses arrive (runs on the reader thread).
+    
+    Kept off the client so the thread does not keep the client alive.
+    """
+    for line in stdout:
+        try:
+            response = _loads(line)
+        except ValueError:
+            continue
+        with pending.lock:
+            future = pending.futures.pop(response.get("id"), None)
+        if future is not None:
+            try:
+                future.set_result(response)
+            except InvalidStateError:  # cancelled by a timed-out waiter
+                pass
+    
+    # EOF: the process is gone, so nothing else will be answered
+    with pending.lock:
+        pending.closed = True
+        futures, pending.futures = pending.futures, {}
+    for future in futures.values():
+        try:
+            future.set_exception(NexusError("Nexus process exited unexpectedly"))
+        except InvalidStateError:
+            pass
+
+
+def _shutdown(process: subprocess.Popen, reader: threading.Thread) -> None:
+    """Stop a nexus process and its reader thread."""
+    if process.poll() is None:
+        try:
+            # Closing stdin sends EOF, which makes the server exit cleanly
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+    reader.join(timeout=5)
+    if not reader.is_alive():
+        process.stdout.close()
+
+
 class NexusClient:
     """Minimal client for the Nexus MCP runtime."""
     
-    def __init__(self, binary_path: str = "nexus"):
-        """Initialize the Nexus client.
+    def __init__(
+        self,
+        binary_path: str = "nexus",
+        client_name: str = "nexus-python-client",
+        cache_ttls: Optional[Dict[str, Optional[float]]] = None,
+        timeout: Optional[float] = 60.0,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Initialize the Nexus client and start the nexus process.
         
         Args:
             binary_path: Path to the nexus binary (default: 'nexus' in PATH)
+            client_name: Name reported to the server during initialization
+            cache_ttls: Read-only tools (e.g. get_time, memory.recall) whose
+                results are reused, mapped to a TTL in seconds (None reuses
+                them until a tool that may write is called). Nothing is
+                reused by default, since the memory store is shared with
+                other processes and its entries can expire.
+            timeout: Seconds to wait for each response before raising
+                NexusError (None waits forever)
+            cache_size: Maximum number of cached results; the least
+                recently used are evicted first
+            
+        Raises:
+            FileNotFoundError: If the nexus binary cannot be found
+            ValueError: If cache_ttls names a tool that may modify state
         """
+        uncacheable = set(cache_ttls or {}) - _READ_ONLY_TOOLS
+        if uncacheable:
+            raise ValueError(f"Cannot cache tools that may modify state: {sorted(uncacheable)}")
         self.binary_path = binary_path
+        self.timeout = timeout
+        self.cache_ttls = dict(cache_ttls or {})
+        self.cache_size = cache_size
+        # (tool, args) -> [fetched_at, output, decoded JSON text or _UNDECODED],
+        # least recently used first
+        self._cache: "OrderedDict[Tuple[str, bytes], List[Any]]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self._pending = _PendingRequests()
+        self._write_lock = threading.Lock()
+        self._process = subprocess.Popen(
+            [binary_path, "--log-level", "error", "--stdio"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        reader = threading.Thread(
+            target=_read_responses,
+            args=(self._process.stdout, self._pending),
+            name="nexus-reader",
+            daemon=True,
+        )
+        reader.start()
+        # Stops the process on close(), garbage collection or interpreter exit
+        self._finalizer = weakref.finalize(self, _shutdown, self._process, reader)
+        
+        # The tools/list probe is pipelined behind initialize
+        init_response, tools_response = self._wait(self._submit([
+            ("initialize", {
+                "protocolVersion": "2024-11-05",
+                "clientInfo": {"name": client_name, "version": "0.1.0"},
+                "capabilities": {},
+            }),
+            ("tools/list", None),
+        ]))
+        self._unwrap("initialize", init_response)
+        tool_names = {tool.get("name") for tool in tools_response.get("result", {}).get("tools", [])}
+        # Whether the server has memory.mset/memory.mget
+        self._has_multi_key_tools = {"memory.mset", "memory.mget"} <= tool_names
+    
+    def __enter__(self) -> "NexusClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the nexus process (safe to call more than once)."""
+        self._process = None
+        self._finalizer()
+    
+    def _request(self, method: str, params: Any = None) -> Dict[str, Any]:
+        """Send one JSON-RPC request to the nexus process and return its result."""
+        return self._request_many([(method, params)])[0]
+    
+    def _request_many(self, requests: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+        """Pipeline JSON-RPC requests: write every frame, then wait for every reply.
+        
+        The server answers stdin requests one at a time, so writing them all
+        up front removes the per-request wait without server batch support.
+        """
+        responses = self._wait(self._submit(requests))
+        return [
+            self._unwrap(method, response)
+            for (method, _), response in zip(requests, responses)
+        ]
+    
+    def _wait(self, futures: List[Future]) -> List[Dict[str, Any]]:
+        """Wait for the raw responses to submitted requests, honouring the timeout."""
+        try:
+            return [future.result(timeout=self.timeout) for future in futures]
+        except FutureTimeoutError:
+            self._forget(futures)
+            raise NexusError(f"No response from nexus within {self.timeout}s")
+    
+    async def _wait_async(self, future: Future) -> Dict[str, Any]:
+        """Await the raw response for a submitted request, honouring the timeout."""
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            self._forget([future])
+            raise NexusError(f"No response from nexus within {self.timeout}s")
+    
+    def _forget(self, futures: List[Future]) -> None:
+        """Stop waiting for requests, e.g. ones the server dropped."""
+        with self._pending.lock:
+            for request_id, future in list(self._pending.futures.items()):
+                if future in futures:
+                    del self._pending.futures[request_id]
+    
+    def _submit(self, requests: List[Tuple[str, Any]]) -> List[Future]:
+        """Write JSON-RPC frames and return futures for their raw responses.
+        
+        Params may be a dict, None, or already-encoded JSON bytes.
+        """
+        process = self._process
+        if process is None:
+            raise NexusError("Nexus process is not running")
+        
+        pending = self._pending
+        ids = []
+        frames = []
+        futures = []
+        with pending.lock:
+            if pending.closed:
+                raise NexusError("Nexus process exited unexpectedly")
+            for method, params in requests:
+                request_id = next(self._ids)
+                future = Future()
+                pending.futures[request_id] = future
+                ids.append(request_id)
+                frames.append(self._encode_frame(request_id, method, params))
+                futures.append(future)
+        
+        try:
+            with self._write_lock:
+                process.stdin.write(b"".join(frames))
+                process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            with pending.lock:
+                for request_id in ids:
+                    pending.futures.pop(request_id, None)
+            raise NexusError("Nexus process exited unexpectedly")
+        
+        return futures
+    
+    @staticmethod
+    def _encode_frame(request_id: int, method: str, params: Any) -> bytes:
+        """Encode one newline-terminated JSON-RPC request."""
+        if isinstance(params, bytes):
+            return b'{"jsonrpc":"2.0","id":%d,"method":%s,"params":%s}\n' % (
+                request_id, _dumps(method), params,
+            )
+        frame = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            frame["params"] = params
+        return _dumps(frame) + b"\n"
+    
+    @staticmethod
+    def _unwrap(method: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the result of a JSON-RPC response or raise its error."""
+        if "error" in response:
+            error = response["error"]
+            raise NexusError(error.get("message") or f"Request '{method}' failed")
+        return response.get("result", {})
     
     def call(self, tool: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Call a Nexus tool.
@@ -37,24 +338,127 @@ class NexusClient:
             args: Optional dictionary of arguments
             
         Returns:
-            Dictionary containing the tool output
+            Dictionary containing the tool output (a copy for cached tools,
+            so it is safe to modify)
             
         Raises:
             NexusError: If tool execution fails
         """
-        args = args or {}
-        args_json = json.dumps(args)
+        return self._copy_output(tool, self._call_entry(tool, args or {})[1])
+    
+    async def call_async(self, tool: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Call a Nexus tool from asyncio code.
         
-        result = subprocess.run(
-            [self.binary_path, "run", tool, "--args", args_json, "--format", "json"],
-            capture_output=True,
-            text=True,
-        )
+        Calls are written to the nexus process as soon as they are made, so
+        independent calls awaited together with asyncio.gather overlap
+        instead of waiting for each other.
+        """
+        return self._copy_output(tool, (await self._call_entry_async(tool, args or {}))[1])
+    
+    def _copy_output(self, tool: str, output: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a tool output that may be shared with the cache."""
+        return copy.deepcopy(output) if tool in _READ_ONLY_TOOLS else output
+    
+    def _call_entry(self, tool: str, args: Dict[str, Any], max_age: Any = _TOOL_TTL) -> List[Any]:
+        """Return the cache entry for a tool call, calling the tool on a miss.
+        
+        max_age is how old (in seconds) a cached result may be, None meaning
+        any age. By default it comes from cache_ttls, and tools not listed
+        there are always called. Results of read-only tools are stored
+        either way, so a later call with a max_age can reuse them; other
+        results are wrapped in an entry that is not stored.
+        """
+        encoded_args = _encode_args(args)
+        key, entry = self._cache_lookup(tool, encoded_args, max_age)
+        if entry is not None:
+            return entry
+        output = self._request("tools/call", _tool_call_params(tool, encoded_args))
+        return self._cache_store(tool, key, output)
+    
+    async def _call_entry_async(self, tool: str, args: Dict[str, Any], max_age: Any = _TOOL_TTL) -> List[Any]:
+        """Async variant of _call_entry."""
+        encoded_args = _encode_args(args)
+        key, entry = self._cache_lookup(tool, encoded_args, max_age)
+        if entry is not None:
+            return entry
+        future, = self._submit([("tools/call", _tool_call_params(tool, encoded_args))])
+        output = self._unwrap("tools/call", await self._wait_async(future))
+        return self._cache_store(tool, key, output)
+    
+    def _cache_lookup(self, tool: str, encoded_args: bytes, max_age: Any) -> Tuple[Optional[Tuple[str, bytes]], Optional[List[Any]]]:
+        """Return the cache key for a call (None if uncacheable) and any fresh entry."""
+        if tool not in _READ_ONLY_TOOLS:
+            return None, None
+        if max_age is _TOOL_TTL:
+            if tool not in self.cache_ttls:
+                return (tool, encoded_args), None
+            max_age = self.cache_ttls[tool]
+        key = (tool, encoded_args)
+        entry = self._cache.get(key)
+        if entry is not None and (max_age is None or time.monotonic() - entry[0] < max_age):
+            self._cache.move_to_end(key)
+            return key, entry
+        return key, None
+    
+    def _cache_store(self, tool: str, key: Optional[Tuple[str, bytes]], output: Dict[str, Any]) -> List[Any]:
+        """Check a fresh tool output, update the cache and return its entry."""
+        self._check_output(tool, output)
+        entry = [time.monotonic(), output, _UNDECODED]
         
-        if result.returncode != 0:
-            raise NexusError(result.stderr.strip() or f"Tool '{tool}' failed")
+        if tool not in _READ_ONLY_TOOLS:
+            self._cache.clear()
+        if key is not None and self.cache_size > 0:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
         
-        return json.loads(result.stdout)
+        return entry
+    
+    def _call_json(self, tool: str, args: Dict[str, Any]) -> Any:
+        """Call a tool whose text output is JSON and return the decoded value.
+        
+        The decoded value is kept with the cache entry, so a cached result
+        is parsed once rather than on every read.
+        """
+        return self._decode_entry(self._call_entry(tool, args))
+    
+    async def _call_json_async(self, tool: str, args: Dict[str, Any]) -> Any:
+        """Async variant of _call_json."""
+        return self._decode_entry(await self._call_entry_async(tool, args))
+    
+    def _decode_entry(self, entry: List[Any]) -> Any:
+        """Return the decoded JSON text of a cache entry, decoding it once."""
+        if entry[2] is _UNDECODED:
+            entry[2] = _loads(self._output_text(entry[1]))
+        return entry[2]
+    
+    def _call_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Pipeline several tool calls over the nexus process (uncached)."""
+        outputs = self._request_many(
+            [("tools/call", _tool_call_params(tool, _encode_args(args))) for tool, args in calls]
+        )
+        if any(tool not in _READ_ONLY_TOOLS for tool, _ in calls):
+            self._cache.clear()
+        for (tool, _), output in zip(calls, outputs):
+            self._check_output(tool, output)
+        return outputs
+    
+    @staticmethod
+    def _check_output(tool: str, output: Dict[str, Any]) -> None:
+        """Raise NexusError if the tool reported a failure."""
+        if output.get("isError"):
+            message = NexusClient._output_text(output)
+            raise NexusError(message or f"Tool '{tool}' failed")
+    
+    @staticmethod
+    def _output_text(output: Dict[str, Any]) -> str:
+        """Return the text of the first content block of a tool output."""
+        return output.get("content", [{}])[0].get("text", "")
+    
+    def cache_clear(self) -> None:
+        """Drop every cached tool result."""
+        self._cache.clear()
     
     def call_text(self, tool: str, args: Optional[Dict[str, Any]] = None) -> str:
         """Call a Nexus tool and return text output.
@@ -66,8 +470,34 @@ class NexusClient:
         Returns:
             Text output from the tool
         """
-        output = self.call(tool, args)
-        return output.get("content", [{}])[0].get("text", "")
+        return self._output_text(self._call_entry(tool, args or {})[1])
+    
+    def call_text_cached(self, tool: str, args: Optional[Dict[str, Any]] = None, ttl_s: float = 1.0) -> str:
+        """Call a read-only Nexus tool and return text output, reusing a recent result.
+        
+        Uses the same cache as cache_ttls, but lets the caller choose how
+        stale a result may be for this call. Only tools that do not modify
+        state (e.g. get_time, echo, memory.recall) can be cached, so a
+        write is never skipped.
+        
+        Args:
+            tool: The tool name to execute
+            args: Optional dictionary of arguments
+            ttl_s: Maximum age in seconds of a cached result to reuse
+            
+        Returns:
+            Text output from the tool
+            
+        Raises:
+            ValueError: If the tool may modify state
+        """
+        if tool not in _READ_ONLY_TOOLS:
+            raise ValueError(f"Tool '{tool}' may modify state and cannot be cached")
+        return self._output_text(self._call_entry(tool, args or {}, ttl_s)[1])
+    
+    async def call_text_async(self, tool: str, args: Optional[Dict[str, Any]] = None) -> str:
+        """Async variant of call_text."""
+        return self._output_text((await self._call_entry_async(tool, args or {}))[1])
     
     def list_tools(self) -> str:
         """List available tools."""
@@ -86,22 +516,62 @@ class NexusClient:
     def memory_recall(self, key: str) -> Optional[str]:
         """Recall a value from persistent memory."""
         try:
-            text = self.call_text("memory.recall", {"key": key})
-            # Parse JSON response
-            data = json.loads(text)
+            data = self._call_json("memory.recall", {"key": key})
             if data.get("found"):
-                return data.get("value")
+                return copy.deepcopy(data.get("value"))
             return None
         except (NexusError, json.JSONDecodeError):
             return None
     
+    async def memory_recall_async(self, key: str) -> Optional[str]:
+        """Async variant of memory_recall."""
+        try:
+            data = await self._call_json_async("memory.recall", {"key": key})
+            if data.get("found"):
+                return copy.deepcopy(data.get("value"))
+            return None
+        except (NexusError, json.JSONDecodeError):
+            return None
+    
+    def memory_mset(self, items: Dict[str, str]) -> bool:
+        """Store several values in persistent memory with a single call.
+        
+        Uses the memory.mset tool, or pipelined memory.store calls on
+        servers that do not provide it.
+        """
+        if not items:
+            return True
+        if self._has_multi_key_tools:
+            self.call("memory.mset", {"items": items})
+            return True
+        self._call_many([("memory.store", {"key": k, "value": v}) for k, v in items.items()])
+        return True
+    
+    def memory_mget(self, keys: List[str]) -> Dict[str, Any]:
+        """Recall several values from persistent memory with a single call.
+        
+        Returns:
+            Dictionary of the keys that were found and their values
+        """
+        if not keys:
+            return {}
+        if self._has_multi_key_tools:
+            data = self._call_json("memory.mget", {"keys": list(keys)})
+            return copy.deepcopy(data.get("items", {}))
+        outputs = self._call_many([("memory.recall", {"key": key}) for key in keys])
+        values = {}
+        for key, output in zip(keys, outputs):
+            data = _loads(self._output_text(output) or "{}")
+            if data.get("found"):
+                values[key] = data.get("value")
+        return values
+    
     def memory_list(self, prefix: Optional[str] = None) -> list:
         """List all memory keys."""
         args = {"prefix": prefix} if prefix else {}
-        text = self.call_text("memory.list", args)
         try:
-            data = json.loads(text)
-            return data.get("keys", [])
+            data = self._call_json("memory.list", args)
+            return list(data.get("keys", []))
         except json.JSONDecodeError:
             return []
 
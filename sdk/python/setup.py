@@ -7,6 +7,7 @@ setup(
     author="Saeed Valipour Alam",
     py_modules=["nexus_client"],
     python_requires=">=3.8",
+    extras_require={"fast": ["orjson"]},
 )
 
 
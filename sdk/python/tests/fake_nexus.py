@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Fake ``nexus --stdio`` server for the SDK tests.
+
+Speaks newline-delimited JSON-RPC like the real binary and implements the
+memory tools against an in-process dict, plus a few test-only tools:
+
+    test.calls   - number of tools/call requests handled so far
+    test.sleep   - answers after ``seconds``, so later requests overtake it
+    test.hang    - never answers
+    test.exit    - exits without answering
+    test.fail    - returns an isError result
+
+Set FAKE_NEXUS_LEGACY=1 to leave out memory.mset/memory.mget, like an
+older server, and FAKE_NEXUS_DB to a JSON file path to keep the memory
+store across processes.
+"""
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+LEGACY = os.environ.get("FAKE_NEXUS_LEGACY") == "1"
+DB_PATH = os.environ.get("FAKE_NEXUS_DB")
+
+TOOLS = ["echo", "get_time", "memory.store", "memory.recall", "memory.delete", "memory.list"]
+if not LEGACY:
+    TOOLS += ["memory.mset", "memory.mget"]
+
+
+def install(directory: str) -> str:
+    """Link this script as ``nexus`` in directory and return a PATH using it."""
+    link = Path(directory) / "nexus"
+    link.symlink_to(Path(__file__).resolve())
+    return directory + os.pathsep + os.environ.get("PATH", "")
+
+
+def main() -> None:
+    kv = {}
+    if DB_PATH and os.path.exists(DB_PATH):
+        with open(DB_PATH) as f:
+            kv = json.load(f)
+    calls = 0
+    write_lock = threading.Lock()
+
+    def reply(request_id, result):
+        line = json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}) + "\n"
+        with write_lock:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    def text(value, is_error=False):
+        if not isinstance(value, str):
+            value = json.dumps(value)
+        return {"content": [{"type": "text", "text": value}], "isError": is_error}
+
+    def save():
+        if DB_PATH:
+            with open(DB_PATH, "w") as f:
+                json.dump(kv, f)
+
+    def call_tool(name, args):
+        if name == "echo":
+            return text(args.get("text", ""))
+        if name == "get_time":
+            return text({"time": "2024-01-01T12:00:00+00:00", "timestamp": 1704110400})
+        if name == "memory.store":
+            kv[args["key"]] = args["value"]
+            save()
+            return text({"success": True})
+        if name == "memory.recall":
+            return text({"found": args["key"] in kv, "value": kv.get(args["key"])})
+        if name == "memory.delete":
+            deleted = kv.pop(args["key"], None) is not None
+            save()
+            return text({"deleted": deleted})
+        if name == "memory.list":
+            return text({"keys": [k for k in kv if k.startswith(args.get("prefix", ""))]})
+        if name == "memory.mset" and not LEGACY:
+            kv.update(args["items"])
+            save()
+            return text({"success": True, "stored": len(args["items"])})
+        if name == "memory.mget" and not LEGACY:
+            return text({
+                "items": {k: kv[k] for k in args["keys"] if k in kv},
+                "missing": [k for k in args["keys"] if k not in kv],
+            })
+        if name == "test.calls":
+            return text({"calls": calls})
+        if name == "test.fail":
+            return text("Execution failed: requested failure", is_error=True)
+        return text(f"Tool not found: {name}", is_error=True)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        method = request["method"]
+        params = request.get("params") or {}
+
+        if method == "initialize":
+            reply(request["id"], {"serverInfo": {"name": "fake-nexus", "version": "0"}})
+        elif method == "tools/list":
+            reply(request["id"], {"tools": [{"name": name} for name in TOOLS]})
+        elif method == "tools/call":
+            calls += 1
+            name, args = params["name"], params.get("arguments", {})
+            if name == "test.hang":
+                continue
+            if name == "test.exit":
+                os._exit(0)
+            if name == "test.sleep":
+                timer = threading.Timer(args["seconds"], reply, (request["id"], text("slept")))
+                timer.start()
+                continue
+            reply(request["id"], call_tool(name, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Tests for NexusClient against the fake nexus server in fake_nexus.py.
+
+Run from the repository root:
+    python3 -m unittest discover -s sdk/python/tests
+"""
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import time
+import unittest
+import weakref
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_nexus
+from nexus_client import NexusClient, NexusError
+
+
+class FakeNexusTestCase(unittest.TestCase):
+    """Puts the fake server on PATH as ``nexus`` for each test."""
+
+    legacy = False
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = {"PATH": fake_nexus.install(tmp.name)}
+        if self.legacy:
+            env["FAKE_NEXUS_LEGACY"] = "1"
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_client(self, **kwargs) -> NexusClient:
+        client = NexusClient(**kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def tool_calls(self, client: NexusClient) -> int:
+        """Number of tools/call requests the server has handled, excluding this one."""
+        return client._call_json("test.calls", {})["calls"] - 1
+
+
+class TestCalls(FakeNexusTestCase):
+
+    def test_call_returns_output(self):
+        client = self.make_client()
+        self.assertEqual(client.call_text("echo", {"text": "hello"}), "hello")
+        self.assertFalse(client.call("echo", {"text": "x"})["isError"])
+
+    def test_tool_error_raises(self):
+        client = self.make_client()
+        with self.assertRaisesRegex(NexusError, "requested failure"):
+            client.call("test.fail")
+        # The client is still usable afterwards
+        self.assertEqual(client.call_text("echo", {"text": "ok"}), "ok")
+
+    def test_async_responses_matched_by_id(self):
+        client = self.make_client()
+
+        async def run():
+            return await asyncio.gather(
+                client.call_text_async("test.sleep", {"seconds": 0.2}),
+                client.call_text_async("echo", {"text": "fast"}),
+            )
+
+        # The echo reply arrives first but still goes to its own caller
+        self.assertEqual(asyncio.run(run()), ["slept", "fast"])
+
+    def test_memory_helpers(self):
+        client = self.make_client()
+        self.assertIsNone(client.memory_recall("missing"))
+        client.memory_store("user:a", "1")
+        self.assertEqual(client.memory_recall("user:a"), "1")
+        self.assertEqual(client.memory_list(prefix="user:"), ["user:a"])
+
+
+class TestTimeoutsAndExit(FakeNexusTestCase):
+
+    def test_timeout_raises_and_client_recovers(self):
+        client = self.make_client(timeout=0.3)
+        with self.assertRaisesRegex(NexusError, "No response"):
+            client.call("test.hang")
+        self.assertEqual(client._pending.futures, {})
+        self.assertEqual(client.call_text("echo", {"text": "after"}), "after")
+
+    def test_async_timeout(self):
+        client = self.make_client(timeout=0.3)
+        with self.assertRaisesRegex(NexusError, "No response"):
+            asyncio.run(client.call_async("test.hang"))
+        self.assertEqual(client._pending.futures, {})
+
+    def test_process_exit_fails_pending_and_later_calls(self):
+        client = self.make_client()
+        with self.assertRaisesRegex(NexusError, "exited unexpectedly"):
+            client.call("test.exit")
+        with self.assertRaises(NexusError):
+            client.call("echo", {"text": "x"})
+
+    def test_close_is_idempotent(self):
+        client = self.make_client()
+        process = client._process
+        client.close()
+        client.close()
+        self.assertIsNotNone(process.poll())
+        with self.assertRaisesRegex(NexusError, "not running"):
+            client.call("echo")
+
+    def test_unreferenced_client_stops_process(self):
+        client = NexusClient()
+        process = client._process
+        ref = weakref.ref(client)
+        del client
+        gc.collect()
+        self.assertIsNone(ref())
+        process.wait(timeout=5)
+
+
+class TestMultiKey(FakeNexusTestCase):
+
+    def test_mset_mget(self):
+        client = self.make_client()
+        self.assertTrue(client._has_multi_key_tools)
+        client.memory_mset({"a": "1", "b": "2"})
+        self.assertEqual(client.memory_mget(["a", "b", "c"]), {"a": "1", "b": "2"})
+        # One call each way
+        self.assertEqual(self.tool_calls(client), 2)
+
+
+class TestMultiKeyFallback(FakeNexusTestCase):
+
+    legacy = True
+
+    def test_mset_mget_fall_back_to_single_key_tools(self):
+        client = self.make_client()
+        self.assertFalse(client._has_multi_key_tools)
+        client.memory_mset({"a": "1", "b": "2"})
+        self.assertEqual(client.memory_mget(["a", "b", "c"]), {"a": "1", "b": "2"})
+        self.assertEqual(self.tool_calls(client), 5)
+
+
+class TestCache(FakeNexusTestCase):
+
+    def test_nothing_cached_by_default(self):
+        client = self.make_client()
+        client.call_text("get_time")
+        client.call_text("get_time")
+        self.assertEqual(self.tool_calls(client), 2)
+
+    def test_opt_in_cache_invalidated_by_writes(self):
+        client = self.make_client(cache_ttls={"memory.recall": None})
+        client.memory_store("a", "1")
+        client.memory_recall("a")
+        client.memory_recall("a")
+        self.assertEqual(self.tool_calls(client), 2)
+
+        client.memory_store("a", "2")
+        self.assertEqual(client.memory_recall("a"), "2")
+
+    def test_cached_output_is_copied(self):
+        client = self.make_client(cache_ttls={"echo": None})
+        client.call("echo", {"text": "x"})["content"].clear()
+        self.assertEqual(client.call_text("echo", {"text": "x"}), "x")
+
+    def test_cache_is_bounded(self):
+        client = self.make_client(cache_ttls={"echo": None}, cache_size=2)
+        for text in ["a", "b", "c"]:
+            client.call("echo", {"text": text})
+        self.assertEqual(len(client._cache), 2)
+
+    def test_call_text_cached(self):
+        client = self.make_client()
+        client.call_text("get_time")
+        client.call_text_cached("get_time", ttl_s=60)
+        self.assertEqual(self.tool_calls(client), 1)
+
+        time.sleep(0.05)
+        client.call_text_cached("get_time", ttl_s=0.01)
+        self.assertEqual(self.tool_calls(client), 3)
+
+    def test_writes_cannot_be_cached(self):
+        client = self.make_client()
+        with self.assertRaises(ValueError):
+            client.call_text_cached("memory.store", {"key": "a", "value": "1"})
+        with self.assertRaises(ValueError):
+            NexusClient(cache_ttls={"memory.store": 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
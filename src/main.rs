@@ -79,6 +79,10 @@ enum Commands {
         #[arg(short, long, default_value = "{}")]
         args: String,
 
+        /// Read the JSON arguments from stdin instead of --args
+        #[arg(long, conflicts_with = "args")]
+        args_stdin: bool,
+
         /// Output format (json, text)
         #[arg(short, long, default_value = "text")]
         format: String,
@@ -121,7 +125,14 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
             config.port = port;
             run_serve_mode(config).await
         }
-        Some(Commands::Run { tool, args, format }) => {
+        Some(Commands::Run { tool, args, args_stdin, format }) => {
+            // Large payloads (e.g. fs.write_file content) can exceed the
+            // OS argv size limit, so they may be piped in on stdin instead
+            let args = if args_stdin {
+                std::io::read_to_string(std::io::stdin())?
+            } else {
+                args
+            };
             run_oneshot_mode(config, &tool, &args, &format).await
         }
         Some(Commands::Tools) => {
@@ -270,6 +281,7 @@ async fn list_tools(config: Config) -> Result<(), Box<dyn std::error::Error>> {
         "echo", "get_time", "uuid.generate",
         "fs.read_file", "fs.write_file", "cmd.exec",
         "memory.store", "memory.recall", "memory.delete", "memory.list",
+        "memory.mset", "memory.mget",
         "http.request",
         "env.get", "env.list", "sys.info",
         "base64.encode", "base64.decode",
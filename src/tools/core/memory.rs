@@ -248,3 +248,210 @@ impl Tool for MemoryListTool {
     }
 }
 
+
+// ============================================================================
+// Memory Multi-Set Tool
+// ============================================================================
+
+/// Tool for storing several key-value pairs in one call.
+#[derive(Debug)]
+pub struct MemoryMsetTool;
+
+#[derive(Deserialize)]
+struct MemoryMsetArgs {
+    items: serde_json::Map<String, Value>,
+    #[serde(default)]
+    ttl_secs: Option<u64>,
+}
+
+#[async_trait]
+impl Tool for MemoryMsetTool {
+    fn definition(&self) -> ToolDefinition {
+        ToolDefinition {
+            name: "memory.mset".to_string(),
+            description: Some("Stores several key-value pairs in the memory store in one call.".to_string()),
+            input_schema: serde_json::json!({
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "object",
+                        "description": "Map of keys to the values to store (any JSON values)"
+                    },
+                    "ttl_secs": {
+                        "type": "integer",
+                        "description": "Optional time-to-live in seconds, applied to every key"
+                    }
+                },
+                "required": ["items"]
+            }),
+        }
+    }
+
+    async fn execute(
+        &self,
+        arguments: Value,
+        state: Arc<RuntimeState>,
+    ) -> Result<ToolOutput, ToolError> {
+        let args: MemoryMsetArgs = serde_json::from_value(arguments)
+            .map_err(|e| ToolError::InvalidInput(e.to_string()))?;
+
+        debug!("Storing {} keys", args.items.len());
+
+        let mut keys = Vec::with_capacity(args.items.len());
+        for (key, value) in args.items {
+            state.memory_store
+                .kv_set(&key, value, args.ttl_secs)
+                .await
+                .map_err(|e| ToolError::ExecutionFailed(e.to_string()))?;
+            keys.push(key);
+        }
+
+        Ok(ToolOutput::text(serde_json::json!({
+            "success": true,
+            "keys": keys,
+            "stored": keys.len()
+        }).to_string()))
+    }
+}
+
+// ============================================================================
+// Memory Multi-Get Tool
+// ============================================================================
+
+/// Tool for recalling several keys in one call.
+#[derive(Debug)]
+pub struct MemoryMgetTool;
+
+#[derive(Deserialize)]
+struct MemoryMgetArgs {
+    keys: Vec<String>,
+}
+
+#[async_trait]
+impl Tool for MemoryMgetTool {
+    fn definition(&self) -> ToolDefinition {
+        ToolDefinition {
+            name: "memory.mget".to_string(),
+            description: Some("Recalls several values from the memory store in one call.".to_string()),
+            input_schema: serde_json::json!({
+                "type": "object",
+                "properties": {
+                    "keys": {
+                        "type": "array",
+                        "items": { "type": "string" },
+                        "description": "The keys to recall"
+                    }
+                },
+                "required": ["keys"]
+            }),
+        }
+    }
+
+    async fn execute(
+        &self,
+        arguments: Value,
+        state: Arc<RuntimeState>,
+    ) -> Result<ToolOutput, ToolError> {
+        let args: MemoryMgetArgs = serde_json::from_value(arguments)
+            .map_err(|e| ToolError::InvalidInput(e.to_string()))?;
+
+        debug!("Recalling {} keys", args.keys.len());
+
+        let mut items = serde_json::Map::new();
+        let mut missing = Vec::new();
+        for key in args.keys {
+            let result = state.memory_store
+                .kv_get(&key)
+                .await
+                .map_err(|e| ToolError::ExecutionFailed(e.to_string()))?;
+
+            match result {
+                Some(kv) => {
+                    items.insert(key, kv.value);
+                }
+                None => missing.push(key),
+            }
+        }
+
+        Ok(ToolOutput::text(serde_json::json!({
+            "items": items,
+            "missing": missing
+        }).to_string()))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::core::Config;
+    use crate::memory::SqliteStore;
+    use crate::tools::ToolContent;
+
+    fn test_state() -> Arc<RuntimeState> {
+        let mut state = RuntimeState::new(Config::default());
+        state.memory_store = Arc::new(SqliteStore::in_memory().unwrap());
+        Arc::new(state)
+    }
+
+    fn output_json(output: &ToolOutput) -> Value {
+        match &output.content[0] {
+            ToolContent::Text { text } => serde_json::from_str(text).unwrap(),
+            other => panic!("unexpected content: {:?}", other),
+        }
+    }
+
+    #[tokio::test]
+    async fn test_memory_mset_mget() {
+        let state = test_state();
+
+        let params = serde_json::json!({
+            "items": {"a": "1", "b": {"nested": true}}
+        });
+        let output = MemoryMsetTool.execute(params, state.clone()).await.unwrap();
+        let value = output_json(&output);
+        assert_eq!(value["success"], true);
+        assert_eq!(value["stored"], 2);
+
+        let params = serde_json::json!({"keys": ["a", "b", "missing_key"]});
+        let output = MemoryMgetTool.execute(params, state).await.unwrap();
+        let value = output_json(&output);
+        assert_eq!(value["items"]["a"], "1");
+        assert_eq!(value["items"]["b"], serde_json::json!({"nested": true}));
+        assert_eq!(value["missing"], serde_json::json!(["missing_key"]));
+    }
+
+    #[tokio::test]
+    async fn test_memory_mset_ttl() {
+        let state = test_state();
+
+        let params = serde_json::json!({"items": {"temp": 1}, "ttl_secs": 60});
+        MemoryMsetTool.execute(params, state.clone()).await.unwrap();
+        let params = serde_json::json!({"items": {"kept": 2}});
+        MemoryMsetTool.execute(params, state.clone()).await.unwrap();
+
+        let temp = state.memory_store.kv_get("temp").await.unwrap().unwrap();
+        assert!(temp.expires_at.is_some());
+        let kept = state.memory_store.kv_get("kept").await.unwrap().unwrap();
+        assert!(kept.expires_at.is_none());
+    }
+
+    #[tokio::test]
+    async fn test_memory_mget_all_missing() {
+        let state = test_state();
+
+        let params = serde_json::json!({"keys": ["x", "y"]});
+        let output = MemoryMgetTool.execute(params, state).await.unwrap();
+        let value = output_json(&output);
+        assert_eq!(value["items"], serde_json::json!({}));
+        assert_eq!(value["missing"], serde_json::json!(["x", "y"]));
+    }
+
+    #[tokio::test]
+    async fn test_memory_mset_invalid_input() {
+        let state = test_state();
+
+        let params = serde_json::json!({"items": ["not", "an", "object"]});
+        let result = MemoryMsetTool.execute(params, state).await;
+        assert!(matches!(result, Err(ToolError::InvalidInput(_))));
+    }
+}
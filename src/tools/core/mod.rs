@@ -22,7 +22,10 @@ pub use get_time::GetTimeTool;
 pub use fs_read::FsReadTool;
 pub use fs_write::FsWriteTool;
 pub use cmd_exec::CmdExecTool;
-pub use memory::{MemoryStoreTool, MemoryRecallTool, MemoryDeleteTool, MemoryListTool};
+pub use memory::{
+    MemoryStoreTool, MemoryRecallTool, MemoryDeleteTool, MemoryListTool,
+    MemoryMsetTool, MemoryMgetTool,
+};
 pub use http_request::HttpRequestTool;
 pub use env::{EnvGetTool, EnvListTool, SysInfoTool};
 pub use utils::{
@@ -52,6 +55,8 @@ pub fn register_core_tools(registry: &mut ToolRegistry, config: &Config) {
     registry.register(Arc::new(MemoryRecallTool));
     registry.register(Arc::new(MemoryDeleteTool));
     registry.register(Arc::new(MemoryListTool));
+    registry.register(Arc::new(MemoryMsetTool));
+    registry.register(Arc::new(MemoryMgetTool));
 
     // HTTP request tool (restricted by config)
     registry.register(Arc::new(HttpRequestTool::new(config)));
@@ -73,8 +78,8 @@ pub fn register_core_tools(registry: &mut ToolRegistry, config: &Config) {
 
 /// Returns the count of core tools.
 pub fn core_tool_count() -> usize {
-    18 // echo, get_time, uuid, fs.read, fs.write, cmd.exec, 
-       // memory.store/recall/delete/list, http.request,
+    23 // echo, get_time, uuid, fs.read, fs.write, cmd.exec, 
+       // memory.store/recall/delete/list/mset/mget, http.request,
        // env.get/list, sys.info, base64.encode/decode,
        // json.parse/query, hash.sha256, regex.match/replace
 }
@@ -5,8 +5,9 @@
 
 use axum::{
     extract::State,
+    http::StatusCode,
     middleware as axum_mw,
-    response::Sse,
+    response::{IntoResponse, Response as HttpResponse, Sse},
     routing::{get, post},
     Json, Router,
 };
@@ -113,19 +114,65 @@ async fn metrics_handler(
 async fn mcp_handler(
     State(state): State<SseState>,
     Json(body): Json<Value>,
-) -> Json<Value> {
+) -> HttpResponse {
     debug!("Received MCP request: {:?}", body);
 
-    // Parse the request
+    match body {
+        // JSON-RPC 2.0 batch: handle each request and reply with an array
+        Value::Array(batch) => {
+            if batch.is_empty() {
+                let error_response = Response::error(
+                    RequestId::Null,
+                    ErrorObject::invalid_request("Empty batch"),
+                );
+                return Json(serde_json::to_value(error_response).unwrap_or_default()).into_response();
+            }
+
+            let mut responses = Vec::with_capacity(batch.len());
+            for item in batch {
+                if let Some(response) = handle_mcp_request(&state, item).await {
+                    responses.push(response);
+                }
+            }
+
+            // A batch of only notifications gets no response body
+            if responses.is_empty() {
+                return StatusCode::ACCEPTED.into_response();
+            }
+            Json(Value::Array(responses)).into_response()
+        }
+        body => match handle_mcp_request(&state, body).await {
+            Some(response) => Json(response).into_response(),
+            None => StatusCode::ACCEPTED.into_response(),
+        },
+    }
+}
+
+/// Parses, validates and routes a single JSON-RPC request.
+///
+/// Returns `None` for notifications (requests without an `id`), which
+/// are handled but get no response.
+async fn handle_mcp_request(state: &SseState, mut body: Value) -> Option<Value> {
+    // Route notifications with a null id and drop their response
+    let is_notification = match body.as_object_mut() {
+        Some(object) if !object.contains_key("id") => {
+            object.insert("id".to_string(), Value::Null);
+            true
+        }
+        _ => false,
+    };
+
+    // The body is already valid JSON, so a value that is not a request
+    // object is an invalid request rather than a parse error
     let request: Request = match serde_json::from_value(body) {
         Ok(req) => req,
         Err(e) => {
-            error!("Failed to parse request: {}", e);
+            error!("Invalid request: {}", e);
             let error_response = Response::error(
                 RequestId::Null,
-                ErrorObject::parse_error(e.to_string()),
+                ErrorObject::invalid_request(e.to_string()),
             );
-            return Json(serde_json::to_value(error_response).unwrap_or_default());
+            return Some(serde_json::to_value(error_response).unwrap_or_default());
         }
     };
 
@@ -133,12 +180,15 @@ async fn mcp_handler(
     if let Err(e) = request.validate() {
         error!("Invalid request: {}", e);
         let error_response = Response::from_error(request.id.clone(), &e);
-        return Json(serde_json::to_value(error_response).unwrap_or_default());
+        return Some(serde_json::to_value(error_response).unwrap_or_default());
     }
 
     // Route and handle the request
     let response = state.router.handle(request, state.runtime.clone()).await;
-    Json(serde_json::to_value(response).unwrap_or_default())
+    if is_notification {
+        return None;
+    }
+    Some(serde_json::to_value(response).unwrap_or_default())
 }
 
 /// SSE endpoint for streaming (placeholder for future implementation).
@@ -189,3 +239,133 @@ pub async fn start_server(state: SseState, config: &Config, addr: std::net::Sock
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn test_state() -> SseState {
+        SseState {
+            runtime: Arc::new(RuntimeState::new(Config::default())),
+            router: Arc::new(McpRouter::new()),
+            metrics: Metrics::new(),
+        }
+    }
+
+    /// Calls the /mcp handler and returns the status and decoded body
+    /// (null when the body is empty).
+    async fn post_mcp(body: Value) -> (StatusCode, Value) {
+        let response = mcp_handler(State(test_state()), Json(body)).await;
+        let status = response.status();
+        let bytes = axum::body::to_bytes(response.into_body(), usize::MAX).await.unwrap();
+        if bytes.is_empty() {
+            return (status, Value::Null);
+        }
+        (status, serde_json::from_slice(&bytes).unwrap())
+    }
+
+    fn response_with_id(responses: &[Value], id: Value) -> &Value {
+        responses
+            .iter()
+            .find(|response| response["id"] == id)
+            .unwrap_or_else(|| panic!("no response with id {}", id))
+    }
+
+    #[tokio::test]
+    async fn test_mcp_handler_single_request() {
+        let body = serde_json::json!({"jsonrpc": "2.0", "id": 1, "method": "ping"});
+
+        let (status, response) = post_mcp(body).await;
+        assert_eq!(status, StatusCode::OK);
+        assert_eq!(response["id"], 1);
+        assert!(response.get("result").is_some());
+    }
+
+    #[tokio::test]
+    async fn test_mcp_handler_batch() {
+        let body = serde_json::json!([
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {
+                "jsonrpc": "2.0",
+                "id": "echo",
+                "method": "tools/call",
+                "params": {"name": "echo", "arguments": {"text": "batched"}}
+            },
+            {"jsonrpc": "2.0", "id": 3, "method": "no/such/method"}
+        ]);
+
+        let (_, response) = post_mcp(body).await;
+        let responses = response.as_array().unwrap();
+        assert_eq!(responses.len(), 3);
+
+        assert!(response_with_id(responses, serde_json::json!(1)).get("result").is_some());
+
+        let echo = response_with_id(responses, serde_json::json!("echo"));
+        let text = echo["result"]["content"][0]["text"].as_str().unwrap();
+        assert!(text.contains("batched"));
+
+        let unknown = response_with_id(responses, serde_json::json!(3));
+        assert!(unknown.get("error").is_some());
+    }
+
+    #[tokio::test]
+    async fn test_mcp_handler_batch_with_invalid_entries() {
+        let body = serde_json::json!([
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"not": "a request"},
+            {"jsonrpc": "1.0", "id": 2, "method": "ping"}
+        ]);
+
+        let (_, response) = post_mcp(body).await;
+        let responses = response.as_array().unwrap();
+        assert_eq!(responses.len(), 3);
+
+        // A bad entry fails on its own without affecting the others
+        assert!(response_with_id(responses, serde_json::json!(1)).get("result").is_some());
+
+        // Valid JSON that is not a request object is an invalid request
+        let not_a_request = response_with_id(responses, Value::Null);
+        assert_eq!(not_a_request["error"]["code"], -32600);
+
+        let invalid = response_with_id(responses, serde_json::json!(2));
+        assert_eq!(invalid["error"]["code"], -32600);
+    }
+
+    #[tokio::test]
+    async fn test_mcp_handler_batch_skips_notifications() {
+        let body = serde_json::json!([
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+        ]);
+
+        let (_, response) = post_mcp(body).await;
+        let responses = response.as_array().unwrap();
+        assert_eq!(responses.len(), 1);
+        assert_eq!(responses[0]["id"], 1);
+    }
+
+    #[tokio::test]
+    async fn test_mcp_handler_notifications_only() {
+        let body = serde_json::json!([
+            {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        ]);
+        let (status, response) = post_mcp(body).await;
+        assert_eq!(status, StatusCode::ACCEPTED);
+        assert_eq!(response, Value::Null);
+
+        let body = serde_json::json!({"jsonrpc": "2.0", "method": "notifications/initialized"});
+        let (status, response) = post_mcp(body).await;
+        assert_eq!(status, StatusCode::ACCEPTED);
+        assert_eq!(response, Value::Null);
+    }
+
+    #[tokio::test]
+    async fn test_mcp_handler_empty_batch() {
+        let body = serde_json::json!([]);
+
+        let (_, response) = post_mcp(body).await;
+        assert!(response.is_object());
+        assert_eq!(response["id"], Value::Null);
+        assert_eq!(response["error"]["code"], -32600);
+    }
+}